@@ -0,0 +1,319 @@
+"""
+loadtest.py
+
+A load generator for capacity planning. Drives main.play_game headless with
+scripted or random simulated players spread across worker processes, and
+reports turns per second, result counts and turn latency percentiles for each
+difficulty level.
+"""
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from board import Board
+from main import MoveSource, play_game
+
+# Result labels from the simulated client's point of view (play_game codes)
+RESULT_LABELS = [(1, "win"), (2, "loss"), (0, "draw"), (-1, "quit")]
+
+
+class RandomPlayer:
+    """
+    A simulated client that plays a random valid move every turn.
+    """
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            seed (int or None): Seed for this player's private RNG.
+        """
+        self.rng = random.Random(seed)
+
+    def __call__(self, board: Board) -> int:
+        return self.rng.choice(board.get_available_moves())
+
+
+class ScriptedPlayer:
+    """
+    A simulated client that follows a fixed preference list of moves.
+    """
+    def __init__(self, moves: Sequence[int]) -> None:
+        """
+        Args:
+            moves (list[int]): 0-indexed positions, in order of preference.
+        """
+        self.moves: List[int] = list(moves)
+
+    def __call__(self, board: Board) -> int:
+        """
+        Plays the first scripted move that is still open, or quits (-1)
+        once the script has nothing valid left.
+        """
+        for move in self.moves:
+            if board.is_valid_move(move):
+                return move
+        return -1
+
+
+class TurnTimer:
+    """
+    Wraps a move source and times each AI response: the wall-clock and CPU
+    time between the client submitting a move and the AI having answered.
+    """
+    def __init__(self, source: MoveSource) -> None:
+        self.source: MoveSource = source
+        self.latencies: List[float] = []
+        self.cpu_times: List[float] = []
+        self._board: Optional[Board] = None
+        self._empty_after_client: int = 0
+        self._wall_start: Optional[float] = None
+        self._cpu_start: float = 0.0
+
+    def start(self) -> None:
+        """
+        Starts timing an AI response from now, e.g. when the AI moves first.
+        """
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def _stop(self) -> None:
+        if self._wall_start is not None:
+            self.latencies.append(time.perf_counter() - self._wall_start)
+            self.cpu_times.append(time.thread_time() - self._cpu_start)
+            self._wall_start = None
+
+    def finish(self) -> None:
+        """
+        Closes the pending measurement when the game ends, but only if the AI
+        actually moved after the client's last move. A game the client ended
+        (by winning, filling the board or quitting) records no extra turn.
+        """
+        if self._board is not None and \
+           len(self._board.get_available_moves()) >= self._empty_after_client:
+            self._wall_start = None
+        self._stop()
+
+    def __call__(self, board: Board) -> int:
+        # Being asked again means the AI has answered the previous move
+        self._stop()
+        move = self.source(board)
+        if move != -1:
+            self._board = board
+            self._empty_after_client = len(board.get_available_moves()) - 1
+            self.start()
+        return move
+
+
+class LoadStats:
+    """
+    Aggregated results of one load run at a single difficulty.
+    """
+    def __init__(self, difficulty: int, games: int, latencies: List[float],
+                 cpu_times: List[float], elapsed: float, results: Dict[int, int]) -> None:
+        self.difficulty: int = difficulty
+        self.games: int = games
+        self.latencies: List[float] = sorted(latencies)
+        self.cpu_times: List[float] = sorted(cpu_times)
+        self.elapsed: float = elapsed
+        self.results: Dict[int, int] = results
+
+    @property
+    def turns(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.elapsed if self.elapsed > 0 else 0.0
+
+    @staticmethod
+    def _percentile(values: List[float], pct: float) -> float:
+        if not values:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * len(values)))
+        return values[min(rank, len(values)) - 1]
+
+    def percentile(self, pct: float) -> float:
+        """
+        Nearest-rank percentile of the wall-clock turn latencies.
+
+        Args:
+            pct (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Latency in seconds, or 0.0 if no turns were recorded.
+        """
+        return self._percentile(self.latencies, pct)
+
+    def cpu_percentile(self, pct: float) -> float:
+        """
+        Nearest-rank percentile of the CPU time the game spent per turn.
+
+        Args:
+            pct (float): Percentile between 0 and 100.
+
+        Returns:
+            float: CPU seconds, or 0.0 if no turns were recorded.
+        """
+        return self._percentile(self.cpu_times, pct)
+
+    def format(self) -> str:
+        """
+        Renders a one-line report for this difficulty.
+
+        Returns:
+            str: Games, results, turns/s and p50/p90/p99 wall and CPU time in
+            milliseconds, flagged if any simulated games quit early. Turns/s
+            excludes worker process startup and shutdown.
+        """
+        outcomes = " ".join(f"{label} {self.results.get(code, 0)}" for code, label in RESULT_LABELS)
+        line = (f"difficulty {self.difficulty}: {self.games} games ({outcomes}), "
+                f"{self.turns} turns, {self.turns_per_second:.1f} turns/s, "
+                f"wall p50 {self.percentile(50) * 1000:.2f}ms "
+                f"p90 {self.percentile(90) * 1000:.2f}ms "
+                f"p99 {self.percentile(99) * 1000:.2f}ms, "
+                f"cpu p50 {self.cpu_percentile(50) * 1000:.2f}ms "
+                f"p90 {self.cpu_percentile(90) * 1000:.2f}ms "
+                f"p99 {self.cpu_percentile(99) * 1000:.2f}ms")
+        quits = self.results.get(-1, 0)
+        if quits:
+            line += f" [WARNING: {quits} games quit before finishing]"
+        return line
+
+
+def run_client(difficulty: int, human_starts: bool,
+               source: MoveSource) -> Tuple[int, List[float], List[float]]:
+    """
+    Plays one headless game with a simulated client and times each AI turn.
+
+    Args:
+        difficulty (int): AI difficulty, 1-3.
+        human_starts (bool): Whether the simulated client moves first.
+        source (MoveSource): The simulated client.
+
+    Returns:
+        tuple[int, list[float], list[float]]: The play_game result, and the
+        wall-clock and CPU seconds of each AI turn.
+    """
+    timer = TurnTimer(source)
+    if not human_starts:
+        timer.start()
+    result = play_game(difficulty, human_starts, move_source=timer, render=False)
+    timer.finish()
+    return result, timer.latencies, timer.cpu_times
+
+
+def make_player(index: int, script: Optional[Sequence[int]],
+                seed: Optional[int]) -> MoveSource:
+    """
+    Builds the simulated client for game number index.
+
+    Args:
+        index (int): The game's position in the run.
+        script (list[int] or None): 0-indexed moves for a ScriptedPlayer, or
+            None for a RandomPlayer.
+        seed (int or None): Base seed; game i uses seed + i.
+
+    Returns:
+        MoveSource: The simulated client.
+    """
+    if script:
+        return ScriptedPlayer(script)
+    return RandomPlayer(None if seed is None else seed + index)
+
+
+def play_one(job: Tuple[int, int, Optional[Sequence[int]], Optional[int]]
+             ) -> Tuple[int, List[float], List[float]]:
+    """
+    Worker-process entry point: plays the game described by job.
+
+    Args:
+        job (tuple): (difficulty, index, script, seed).
+
+    Returns:
+        tuple[int, list[float], list[float]]: See run_client.
+    """
+    difficulty, index, script, seed = job
+    return run_client(difficulty, index % 2 == 0, make_player(index, script, seed))
+
+
+def warm_up(_: int) -> int:
+    """
+    No-op job used to start the worker processes before timing begins.
+
+    Returns:
+        int: The worker's process id.
+    """
+    return os.getpid()
+
+
+def run_load(difficulty: int, players: int, concurrency: int,
+             script: Optional[Sequence[int]] = None, seed: Optional[int] = None) -> LoadStats:
+    """
+    Runs many simulated games in parallel against a single difficulty.
+
+    Games run in separate worker processes, since the game loop is CPU-bound
+    and threads would only queue on the GIL and inflate the latencies.
+
+    Args:
+        difficulty (int): AI difficulty, 1-3.
+        players (int): Total number of simulated games to play.
+        concurrency (int): Number of worker processes, i.e. games in flight.
+        script (list[int] or None): 0-indexed moves for scripted players, or
+            None for random players.
+        seed (int or None): Base seed for random players.
+
+    Returns:
+        LoadStats: Turn throughput, latencies and result counts.
+    """
+    latencies: List[float] = []
+    cpu_times: List[float] = []
+    results: Dict[int, int] = {}
+    jobs = [(difficulty, index, script, seed) for index in range(players)]
+    chunksize = max(1, players // (concurrency * 4))
+
+    with ProcessPoolExecutor(max_workers=concurrency) as pool:
+        # Spin the workers up before starting the clock so turns/s measures
+        # games, not process startup; the clock also stops before shutdown
+        list(pool.map(warm_up, range(concurrency)))
+        start = time.perf_counter()
+        for result, game_latencies, game_cpu in pool.map(play_one, jobs, chunksize=chunksize):
+            latencies.extend(game_latencies)
+            cpu_times.extend(game_cpu)
+            results[result] = results.get(result, 0) + 1
+        elapsed = time.perf_counter() - start
+    return LoadStats(difficulty, players, latencies, cpu_times, elapsed, results)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point: runs the load for each requested difficulty.
+
+    Args:
+        argv (list[str] or None): Arguments to parse, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Load-test the Tic-Tac-Toe game loop.")
+    parser.add_argument("--players", type=int, default=1000,
+                        help="simulated games per difficulty (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=os.cpu_count() or 1,
+                        help="worker processes, i.e. games in flight (default: CPU count)")
+    parser.add_argument("--difficulty", type=int, nargs="+", default=[1, 2, 3], choices=[1, 2, 3],
+                        help="difficulty levels to test (default: 1 2 3)")
+    parser.add_argument("--script", type=int, nargs="+", metavar="POS", choices=range(1, 10),
+                        help="play these 1-9 positions in order instead of random moves")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="base seed for random players")
+    args = parser.parse_args(argv)
+    if args.players < 1:
+        parser.error("--players must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    script = [pos - 1 for pos in args.script] if args.script else None
+    for difficulty in args.difficulty:
+        stats = run_load(difficulty, args.players, args.concurrency, script, args.seed)
+        print(stats.format())
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,15 @@ manages user input, and handles progression flows (play again, difficulty change
 """
 from board import Board
 from ai import AIPlayer
+from profiler import SamplingProfiler
+from typing import Callable, Optional
+import argparse
 import time
 
+# A move source is asked for the human side's move each turn. It receives the
+# current board and returns a valid 0-indexed position, or -1 to quit.
+MoveSource = Callable[[Board], int]
+
 def get_human_move(board: Board) -> int:
     """
     Prompts the human player for a terminal input and validates it.
@@ -33,17 +40,44 @@ def get_human_move(board: Board) -> int:
             
     return -1 # Fallback for static analyzer
 
-def play_game(difficulty: int, human_starts: bool) -> int:
+def ask_play_again() -> bool:
+    """
+    Asks the player whether they want another round.
+    
+    Returns:
+        bool: True if the player typed 'y', False otherwise.
+    """
+    print("\nPlay again? (y/n)")
+    return input().lower() == 'y'
+
+def pause(seconds: float) -> None:
+    """
+    Holds the screen for a moment so messages can be read. Kept as its own
+    function so the profiler can tell cosmetic pauses apart from real work.
+    
+    Args:
+        seconds (float): How long to wait.
+    """
+    time.sleep(seconds)
+
+def play_game(difficulty: int, human_starts: bool,
+              move_source: Optional[MoveSource] = None, render: bool = True) -> int:
     """
     Executes a single continuous round of Tic-Tac-Toe until win/draw/quit.
     
     Args:
         difficulty (int): The current progression level.
         human_starts (bool): Indicates if the human acts first.
+        move_source (MoveSource or None): Supplies the human side's moves.
+            Defaults to get_human_move, which reads from the terminal.
+        render (bool): Draw the board, print messages and pause for the AI.
+            Simulated clients pass False to run the loop headless.
         
     Returns:
         int: 1 for human win, 2 for AI win, 0 for draw, -1 if quit mid-game.
     """
+    if move_source is None:
+        move_source = get_human_move
     board = Board()
     human_player = 'X' if human_starts else 'O'
     ai_player = 'O' if human_starts else 'X'
@@ -52,41 +86,70 @@ def play_game(difficulty: int, human_starts: bool) -> int:
     current_turn: str = 'X'
     
     while not board.is_game_over():
-        board.display()
-        if current_turn == human_player:
+        if render:
+            board.display()
             print(f"Current Difficulty Level: {difficulty}  |  You are '{human_player}'")
-            move = get_human_move(board)
+        if current_turn == human_player:
+            move = move_source(board)
             if move == -1:
                 return -1 # Quit
             board.make_move(move, human_player)
             current_turn = ai.player
         else:
-            print(f"Current Difficulty Level: {difficulty}  |  You are '{human_player}'")
-            print("AI is thinking...")
-            time.sleep(0.5) # Slight pause for effect
+            if render:
+                print("AI is thinking...")
+                pause(0.5) # Slight pause for effect
             move = ai.get_move(board)
             if move is not None:
                 board.make_move(move, ai.player)
             current_turn = human_player
 
-    board.display()
+    if render:
+        board.display()
     winner = board.check_winner()
     if winner == human_player:
-        print("You win!")
+        if render:
+            print("You win!")
         return 1
     elif winner == ai.player:
-        print("AI wins!")
+        if render:
+            print("AI wins!")
         return 2
     else:
-        print("It's a draw!")
+        if render:
+            print("It's a draw!")
         return 0
         
     return -1 # Fallback for static analyzer
 
-def main() -> None:
+def main(profile_path: Optional[str] = None, profile_interval: float = 0.005) -> None:
     """
     The master runtime loop. Manages difficulty variables and asks
     the player if they want to play another round when the game concludes.
+    
+    Args:
+        profile_path (str or None): If set, sample the session and write
+            collapsed stacks for flamegraph tools to this file on exit.
+        profile_interval (float): Seconds between profiler samples.
+    """
+    if profile_path is None:
+        run_session()
+        return
+
+    profiler = SamplingProfiler(interval=profile_interval)
+    with profiler:
+        try:
+            run_session()
+        except KeyboardInterrupt:
+            pass
+    profiler.write_collapsed(profile_path)
+    print(profiler.summary())
+    print(f"Collapsed stacks written to {profile_path}")
+
+def run_session() -> None:
+    """
+    Plays rounds back to back, adjusting difficulty after each result,
+    until the player quits or declines to play again.
     """
     difficulty: int = 1 # Start at easy
     human_starts: bool = True
@@ -101,20 +164,24 @@ def main() -> None:
             if difficulty < 3:
                 difficulty = difficulty + 1 # type: ignore
                 print("You're getting better! Increasing AI difficulty.")
-                time.sleep(1.5)
+                pause(1.5)
         elif result == 2:
             if difficulty > 1:
                 difficulty = difficulty - 1 # type: ignore
                 print("AI was too strong! Decreasing difficulty.")
-                time.sleep(1.5)
+                pause(1.5)
                 
         human_starts = not human_starts
         
-        print("\nPlay again? (y/n)")
-        choice = input().lower()
-        if choice != 'y':
+        if not ask_play_again():
             print("Thanks for playing!")
             break
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Retro terminal Tic-Tac-Toe.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the session and write collapsed stacks to PATH")
+    parser.add_argument("--profile-interval", type=float, default=0.005, metavar="SECONDS",
+                        help="seconds between profiler samples (default: 0.005)")
+    args = parser.parse_args()
+    main(profile_path=args.profile, profile_interval=args.profile_interval)
@@ -0,0 +1,203 @@
+"""
+profiler.py
+
+Contains the SamplingProfiler class, an opt-in, standard-library-only stack
+sampler used to triage slow turns. It attributes wall-clock time to board
+checks, minimax search, rendering, cosmetic pauses and waiting on player
+input, and exports collapsed stacks that flamegraph tools (flamegraph.pl,
+speedscope) can read.
+"""
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Functions we care about when deciding where a slow turn went. The innermost
+# match on the sampled stack wins, so a check_winner call made from inside
+# minimax is counted as check_winner.
+TRACKED_FUNCTIONS = {
+    "Board.check_winner": "Board.check_winner",
+    "AIPlayer.minimax": "AIPlayer.minimax",
+    "Board.display": "Board.display",
+}
+
+# input() and time.sleep() are builtins with no Python frame of their own, so
+# a sample whose innermost frame is one of these wrappers is the player thread
+# blocked on stdin or sitting in a cosmetic pause.
+INPUT_FUNCTIONS = {"get_human_move", "ask_play_again"}
+PAUSE_FUNCTIONS = {"pause"}
+INPUT_WAIT = "input wait"
+PAUSE = "pause"
+OTHER = "other"
+
+
+class SamplingProfiler:
+    """
+    Periodically samples the call stack of the thread that started it.
+    """
+    def __init__(self, interval: float = 0.005) -> None:
+        """
+        Initialize the profiler with a sampling rate.
+
+        Args:
+            interval (float): Seconds between samples. Defaults to 5ms.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        self.interval: float = interval
+        self.stacks: Counter = Counter()
+        self.categories: Counter = Counter()
+        self.seconds: Counter = Counter()
+        self._target_id: Optional[int] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._saved_switch_interval: Optional[float] = None
+
+    def start(self) -> None:
+        """
+        Begins sampling the calling thread on a background daemon thread.
+        """
+        if self._thread is not None:
+            raise RuntimeError("profiler is already running")
+        self._target_id = threading.get_ident()
+        self._stop_event.clear()
+        # A CPU-bound target holds the GIL for up to the switch interval (5ms by
+        # default), so shorten it to let the sampler wake close to on time
+        self._saved_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._saved_switch_interval, self.interval / 10))
+        self._thread = threading.Thread(target=self._run, name="ttt-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops sampling and waits for the background thread to finish.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        if self._saved_switch_interval is not None:
+            sys.setswitchinterval(self._saved_switch_interval)
+            self._saved_switch_interval = None
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        """
+        Sampling loop executed on the background thread. Each sample is
+        weighted by the real time since the previous one, since the sampler
+        can wake late when the target thread is holding the GIL.
+        """
+        last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)  # type: ignore
+            now = time.perf_counter()
+            if frame is not None:
+                self.record(self.stack_from_frame(frame), now - last)
+            last = now
+
+    @staticmethod
+    def stack_from_frame(frame) -> Tuple[str, ...]:
+        """
+        Converts a live frame into a root-first tuple of function names.
+
+        Args:
+            frame (FrameType): The innermost frame of the sampled thread.
+
+        Returns:
+            tuple[str, ...]: Qualified function names, outermost first.
+        """
+        names: List[str] = []
+        while frame is not None:
+            names.append(frame.f_code.co_qualname)
+            frame = frame.f_back
+        names.reverse()
+        return tuple(names)
+
+    @staticmethod
+    def categorize(stack: Tuple[str, ...]) -> str:
+        """
+        Determines which tracked activity a sampled stack belongs to.
+
+        Args:
+            stack (tuple[str, ...]): Root-first function names.
+
+        Returns:
+            str: One of the TRACKED_FUNCTIONS labels, INPUT_WAIT, PAUSE, or OTHER.
+        """
+        if stack and stack[-1] in INPUT_FUNCTIONS:
+            return INPUT_WAIT
+        if stack and stack[-1] in PAUSE_FUNCTIONS:
+            return PAUSE
+        for name in reversed(stack):
+            if name in TRACKED_FUNCTIONS:
+                return TRACKED_FUNCTIONS[name]
+        return OTHER
+
+    def record(self, stack: Tuple[str, ...], weight: Optional[float] = None) -> None:
+        """
+        Adds a single sample to the stack and category tallies.
+
+        Args:
+            stack (tuple[str, ...]): Root-first function names.
+            weight (float or None): Seconds this sample stands for. Defaults
+                to the sampling interval.
+        """
+        category = self.categorize(stack)
+        if category in (INPUT_WAIT, PAUSE):
+            # Give flamegraphs a visible leaf for time spent blocked or sleeping
+            stack = stack + (f"[{category}]",)
+        self.stacks[stack] += 1
+        self.categories[category] += 1
+        self.seconds[category] += self.interval if weight is None else weight
+
+    def category_seconds(self) -> Dict[str, float]:
+        """
+        Estimates the wall-clock time spent in each tracked activity.
+
+        Returns:
+            dict[str, float]: Seconds per category, summed from sample weights.
+        """
+        return dict(self.seconds)
+
+    def collapsed(self) -> str:
+        """
+        Renders the samples in the collapsed-stack format used by flamegraph tools.
+
+        Returns:
+            str: One "frame;frame;frame count" line per unique stack.
+        """
+        lines = [f"{';'.join(stack)} {count}" for stack, count in sorted(self.stacks.items())]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def write_collapsed(self, path: str) -> None:
+        """
+        Writes the collapsed-stack output to disk.
+
+        Args:
+            path (str): Destination file, e.g. 'profile.folded'.
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(self.collapsed())
+
+    def summary(self) -> str:
+        """
+        Builds a short human-readable breakdown of where time went.
+
+        Returns:
+            str: One line per category, largest first.
+        """
+        samples = sum(self.categories.values())
+        total = sum(self.seconds.values())
+        lines = [f"Profile: {samples} samples @ {self.interval * 1000:.1f}ms, {total:.3f}s"]
+        for name, seconds in self.seconds.most_common():
+            share = 100.0 * seconds / total if total > 0 else 0.0
+            lines.append(f"  {name:<20} {seconds:8.3f}s {share:5.1f}%")
+        return "\n".join(lines)
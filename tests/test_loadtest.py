@@ -0,0 +1,103 @@
+import pytest
+import sys
+import os
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from board import Board
+from loadtest import RandomPlayer, ScriptedPlayer, TurnTimer, LoadStats, run_client, run_load
+import loadtest
+
+def lowest_open_square(board):
+    return board.get_available_moves()[0]
+
+def test_scripted_player_skips_taken_squares_then_quits():
+    b = Board()
+    b.make_move(0, "O")
+    p = ScriptedPlayer([0, 4])
+    assert p(b) == 4
+    b.make_move(4, "O")
+    assert p(b) == -1
+
+def test_random_player_is_valid_and_seeded():
+    b = Board()
+    b.make_move(4, "X")
+    assert RandomPlayer(seed=7)(b) == RandomPlayer(seed=7)(b)
+    assert b.is_valid_move(RandomPlayer()(b))
+
+def test_turn_timer_records_each_ai_response():
+    b = Board()
+    timer = TurnTimer(lambda board: board.get_available_moves()[-1])
+    b.make_move(timer(b), "X")
+    b.make_move(0, "O") # AI answers
+    b.make_move(timer(b), "X")
+    b.make_move(1, "O") # AI answers, game ends
+    timer.finish()
+    assert len(timer.latencies) == 2
+    assert len(timer.cpu_times) == 2
+
+def test_turn_timer_ignores_game_ended_by_client():
+    b = Board()
+    timer = TurnTimer(lambda board: board.get_available_moves()[0])
+    b.make_move(timer(b), "X") # client move ends the game, no AI reply
+    timer.finish()
+    assert timer.latencies == []
+
+def test_load_stats_percentiles_and_results():
+    stats = LoadStats(1, 4, [0.004, 0.001, 0.003, 0.002], [0.002, 0.001, 0.001, 0.001],
+                      2.0, {1: 2, 2: 1, 0: 1})
+    assert stats.turns == 4
+    assert stats.turns_per_second == 2.0
+    assert stats.percentile(50) == 0.002
+    assert stats.percentile(99) == 0.004
+    assert stats.cpu_percentile(99) == 0.002
+    assert LoadStats(1, 0, [], [], 0.0, {}).percentile(50) == 0.0
+    line = stats.format()
+    assert "difficulty 1" in line
+    assert "win 2 loss 1 draw 1 quit 0" in line
+    assert "WARNING" not in line
+
+def test_load_stats_flags_quit_games():
+    stats = LoadStats(1, 2, [0.001], [0.001], 1.0, {1: 1, -1: 1})
+    assert "WARNING: 1 games quit before finishing" in stats.format()
+
+@patch('main.AIPlayer.get_move', side_effect=lowest_open_square)
+def test_run_client_ai_starts_counts_ai_turns(mock_ai_move):
+    # AI 'X' takes 0, 1, 2 and wins on its third move; client 'O' plays 3, 4
+    result, latencies, cpu_times = run_client(1, False, ScriptedPlayer([3, 4, 5]))
+    assert result == 2
+    assert mock_ai_move.call_count == 3
+    assert len(latencies) == 3
+    assert len(cpu_times) == 3
+
+@patch('main.AIPlayer.get_move', side_effect=lowest_open_square)
+def test_run_client_human_win_has_no_extra_turn(mock_ai_move):
+    # Client 'X' plays 8, 5, 2 and wins; AI 'O' answers twice with 0 and 1
+    result, latencies, _ = run_client(1, True, ScriptedPlayer([8, 5, 2]))
+    assert result == 1
+    assert mock_ai_move.call_count == 2
+    assert len(latencies) == 2
+
+@patch('main.AIPlayer.get_move', side_effect=lowest_open_square)
+def test_run_client_quit_records_no_turn(mock_ai_move):
+    result, latencies, _ = run_client(1, True, ScriptedPlayer([]))
+    assert result == -1
+    assert latencies == []
+
+def test_run_load_plays_every_game(capsys):
+    stats = run_load(2, players=20, concurrency=2, seed=1)
+    assert sum(stats.results.values()) == 20
+    assert stats.turns > 0
+    assert len(stats.cpu_times) == stats.turns
+    assert capsys.readouterr().out == "" # headless: no rendering
+
+@pytest.mark.parametrize("flag", ["--players", "--concurrency"])
+def test_main_rejects_non_positive_counts(flag, capsys):
+    with pytest.raises(SystemExit):
+        loadtest.main([flag, "0"])
+    assert f"{flag} must be at least 1" in capsys.readouterr().err
+
+@pytest.mark.parametrize("pos", ["0", "10"])
+def test_main_rejects_script_positions_outside_board(pos, capsys):
+    with pytest.raises(SystemExit):
+        loadtest.main(["--script", "5", pos])
+    assert "invalid choice" in capsys.readouterr().err
@@ -122,3 +122,14 @@ def test_main_loop_no_difficulty_decrease_below_1(mock_sleep, mock_play, mock_in
     out = capsys.readouterr().out
     assert "AI was too strong" not in out # because it shouldn't decrease below 1
     assert "You're getting better" in out
+
+@patch('main.time.sleep')
+@patch('main.AIPlayer.get_move', side_effect=lambda board: board.get_available_moves()[0])
+def test_play_game_custom_move_source_headless(mock_ai_move, mock_sleep, capsys):
+    # Human 'X' takes the left column while the AI fills the lowest open square
+    source = MagicMock(side_effect=lambda board: next(m for m in [0, 3, 6] if board.is_valid_move(m)))
+    assert main.play_game(1, True, move_source=source, render=False) == 1
+    assert source.call_count == 3
+    assert mock_ai_move.call_count == 2
+    assert capsys.readouterr().out == ""
+    assert not mock_sleep.called
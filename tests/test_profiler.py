@@ -0,0 +1,100 @@
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from board import Board
+from ai import AIPlayer
+from profiler import SamplingProfiler, INPUT_WAIT, PAUSE, OTHER
+import main
+
+def test_profiler_rejects_non_positive_interval():
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval=0)
+
+def test_categorize_innermost_tracked_function_wins():
+    stack = ("<module>", "AIPlayer.get_hard_move", "AIPlayer.minimax", "Board.check_winner")
+    assert SamplingProfiler.categorize(stack) == "Board.check_winner"
+    assert SamplingProfiler.categorize(stack[:-1]) == "AIPlayer.minimax"
+
+def test_categorize_input_wait_and_other():
+    assert SamplingProfiler.categorize(("run_session", "play_game", "get_human_move")) == INPUT_WAIT
+    assert SamplingProfiler.categorize(("main", "run_session", "ask_play_again")) == INPUT_WAIT
+    assert SamplingProfiler.categorize(("run_session", "play_game")) == OTHER
+    assert SamplingProfiler.categorize(()) == OTHER
+
+def test_record_and_collapsed_output():
+    p = SamplingProfiler(interval=0.01)
+    p.record(("play_game", "Board.display"))
+    p.record(("play_game", "Board.display"))
+    p.record(("play_game", "get_human_move"))
+    assert p.collapsed() == (
+        "play_game;Board.display 2\n"
+        "play_game;get_human_move;[input wait] 1\n"
+    )
+    assert p.category_seconds() == pytest.approx({"Board.display": 0.02, INPUT_WAIT: 0.01})
+    assert "Board.display" in p.summary()
+
+def test_categorize_cosmetic_pauses():
+    assert SamplingProfiler.categorize(("run_session", "play_game", "pause")) == PAUSE
+    assert SamplingProfiler.categorize(("main", "run_session", "pause")) == PAUSE
+    p = SamplingProfiler()
+    p.record(("play_game", "pause"))
+    assert p.collapsed() == "play_game;pause;[pause] 1\n"
+
+def test_stack_from_frame_inside_minimax():
+    frames = []
+    real_is_draw = Board.is_draw
+    def spy_is_draw(self):
+        if not frames:
+            frames.append(sys._getframe())
+        return real_is_draw(self)
+    b = Board()
+    b.make_move(0, "X")
+    b.make_move(4, "O")
+    ai = AIPlayer(difficulty=3, player='O')
+    with patch.object(Board, 'is_draw', spy_is_draw):
+        ai.get_move(b)
+    stack = SamplingProfiler.stack_from_frame(frames[0])
+    assert stack[-2:] == ("AIPlayer.minimax", "test_stack_from_frame_inside_minimax.<locals>.spy_is_draw")
+    assert SamplingProfiler.categorize(stack) == "AIPlayer.minimax"
+
+@pytest.mark.parametrize("interval", [0.001, 0.005])
+def test_profiler_seconds_track_cpu_bound_wall_time(interval):
+    b = Board()
+    b.make_move(0, "X")
+    ai = AIPlayer(difficulty=3, player='O')
+    switch_interval = sys.getswitchinterval()
+    with SamplingProfiler(interval=interval) as p:
+        started = time.perf_counter()
+        ai.get_move(b)
+        wall = time.perf_counter() - started
+    assert sys.getswitchinterval() == switch_interval
+    seconds = p.category_seconds()
+    # Sample weights cover the run up to the last sample, so allow one
+    # interval of slack at each end plus scheduling jitter
+    assert 0.7 * wall - 2 * interval <= sum(seconds.values()) <= 1.2 * wall + 2 * interval
+    searched = seconds.get("AIPlayer.minimax", 0) + seconds.get("Board.check_winner", 0)
+    assert searched >= 0.5 * wall
+
+def test_record_weight_overrides_interval():
+    p = SamplingProfiler(interval=0.005)
+    p.record(("AIPlayer.minimax",), 0.02)
+    p.record(("AIPlayer.minimax",))
+    assert p.category_seconds() == pytest.approx({"AIPlayer.minimax": 0.025})
+    assert p.collapsed() == "AIPlayer.minimax 2\n"
+
+def test_write_collapsed(tmp_path):
+    p = SamplingProfiler()
+    p.record(("a", "b"))
+    out = tmp_path / "profile.folded"
+    p.write_collapsed(str(out))
+    assert out.read_text() == "a;b 1\n"
+
+@patch('main.play_game', side_effect=[-1])
+def test_main_with_profile_writes_file(mock_play, tmp_path, capsys):
+    out = tmp_path / "session.folded"
+    main.main(profile_path=str(out), profile_interval=0.001)
+    assert out.exists()
+    assert "Collapsed stacks written to" in capsys.readouterr().out